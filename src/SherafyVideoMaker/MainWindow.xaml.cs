@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.ObjectModel;
 using System.ComponentModel;
 using System.IO;
@@ -34,6 +35,27 @@ namespace SherafyVideoMaker
 
         private const double DurationToleranceSeconds = 2.5;
 
+        // The on-screen log keeps only the most recent output; the full history is in the log file.
+        private const int MaxLogTextLength = 200_000;
+
+        private readonly object _logLock = new();
+        private readonly StringBuilder _logBuilder = new();
+
+        private bool _isBusy;
+        public bool IsBusy
+        {
+            get => _isBusy;
+            private set
+            {
+                _isBusy = value;
+                OnPropertyChanged(nameof(IsBusy));
+                OnPropertyChanged(nameof(IsIdle));
+            }
+        }
+
+        // Bound to the Load SRT / Validate / Render / Download buttons so a running job cannot be re-entered.
+        public bool IsIdle => !IsBusy;
+
         private string _logText = string.Empty;
         public string LogText
         {
@@ -52,6 +74,13 @@ namespace SherafyVideoMaker
             Settings.AspectRatio = AspectOptions.First();
             Settings.Fps = FpsOptions.First(x => x == 30);
             _logging = new LoggingService(Settings);
+            Closed += (_, _) =>
+            {
+                lock (_logLock)
+                {
+                    _logging.Dispose();
+                }
+            };
         }
 
         private void SegmentsGrid_PreviewDragOver(object sender, System.Windows.DragEventArgs e)
@@ -174,6 +203,11 @@ namespace SherafyVideoMaker
 
         private void LoadSrt(object sender, RoutedEventArgs e)
         {
+            if (IsBusy)
+            {
+                return;
+            }
+
             try
             {
                 Segments.Clear();
@@ -190,11 +224,29 @@ namespace SherafyVideoMaker
                 System.Windows.MessageBox.Show("Failed to load SRT: " + ex.Message);
                 Log("Error while loading SRT: " + ex);
             }
+            finally
+            {
+                FlushLog();
+            }
         }
 
         private async void ValidateSegments(object sender, RoutedEventArgs e)
         {
-            await ValidateSegmentsAsync();
+            if (IsBusy)
+            {
+                return;
+            }
+
+            IsBusy = true;
+            try
+            {
+                await ValidateSegmentsAsync();
+            }
+            finally
+            {
+                IsBusy = false;
+                FlushLog();
+            }
         }
 
         private async Task ValidateSegmentsAsync()
@@ -239,7 +291,23 @@ namespace SherafyVideoMaker
 
         private async void RenderVideo(object sender, RoutedEventArgs e)
         {
-            await RenderVideoAsync();
+            // Segments render off the UI thread, so block a second render (or an SRT reload) from
+            // rewriting temp/clip_N.mp4 and the final output while this one is still running.
+            if (IsBusy)
+            {
+                return;
+            }
+
+            IsBusy = true;
+            try
+            {
+                await RenderVideoAsync();
+            }
+            finally
+            {
+                IsBusy = false;
+                FlushLog();
+            }
         }
 
         private async Task RenderVideoAsync()
@@ -276,18 +344,61 @@ namespace SherafyVideoMaker
 
                 CheckSrtAlignmentAgainstAudio();
 
-                foreach (var segment in Segments.OrderBy(s => s.Index))
+                // Segments render off the UI thread, so workers get snapshots of the settings and segments
+                // (sorted once, clip paths resolved up front) instead of the live objects bound to the UI.
+                var settings = Settings.Snapshot();
+                var renderJobs = Segments.OrderBy(s => s.Index)
+                    .Select(s => (Live: s, Render: s.Snapshot(), ClipPath: ResolveClipPath(s)))
+                    .ToList();
+                var orderedSegments = renderJobs.Select(job => job.Render).ToList();
+
+                var missingClip = renderJobs.FirstOrDefault(job => job.ClipPath is null);
+                if (missingClip.Render is not null)
                 {
-                    var clipPath = ResolveClipPath(segment);
-                    if (clipPath is null)
+                    throw new FileNotFoundException($"Missing clip for segment {missingClip.Render.Index}.");
+                }
+
+                // Pick the encoder once so every segment clip, and therefore the stream-copied concat, uses the same one.
+                var videoEncoder = _ffmpegService.GetVideoEncoder(settings, Log);
+                Log($"Render video encoder: {videoEncoder}.");
+
+                // NVENC session limits are tight on consumer GPUs, and libx264 already threads across all cores,
+                // so parallel renders are opt-in and never used with the GPU encoder.
+                var maxParallelRenders = videoEncoder == FfmpegService.NvencEncoder ? 1 : settings.MaxParallelRenders;
+                var renderOptions = new ParallelOptions { MaxDegreeOfParallelism = maxParallelRenders };
+                Log($"Rendering {orderedSegments.Count} segments with up to {maxParallelRenders} at a time.");
+
+                var failedSegments = new ConcurrentQueue<int>();
+                await Parallel.ForEachAsync(renderJobs, renderOptions, (job, _) =>
+                {
+                    try
                     {
-                        throw new FileNotFoundException($"Missing clip for segment {segment.Index}.");
+                        _ffmpegService.ProcessSegment(settings, job.Render, job.ClipPath!, videoEncoder, Log);
                     }
+                    catch (Exception ex)
+                    {
+                        Log($"Segment {job.Render.Index} failed to render: {ex.Message}");
+                        failedSegments.Enqueue(job.Render.Index);
+                    }
+
+                    return ValueTask.CompletedTask;
+                });
+
+                foreach (var job in renderJobs)
+                {
+                    job.Live.Speed = job.Render.Speed;
+                }
+
+                SegmentsGrid.Items.Refresh();
 
-                    _ffmpegService.ProcessSegment(Settings, segment, clipPath, Log);
+                if (!failedSegments.IsEmpty)
+                {
+                    var failedList = string.Join(", ", failedSegments.OrderBy(i => i));
+                    throw new InvalidOperationException(
+                        $"Rendering failed for segment(s) {failedList}. See log for details.");
                 }
 
-                var outputFile = _ffmpegService.ConcatAndMux(Settings, Segments.OrderBy(s => s.Index).ToList(), Log);
+                var outputFile = _ffmpegService.ConcatAndMux(settings, orderedSegments, videoEncoder, Log);
                 if (outputFile is not null)
                 {
                     System.Windows.MessageBox.Show("Render complete!\n" + outputFile);
@@ -319,12 +430,36 @@ namespace SherafyVideoMaker
         private void Log(string message)
         {
             var line = $"[{DateTime.Now:HH:mm:ss}] {message}";
-            _logging.Write(line);
 
-            var builder = new StringBuilder(LogText.Length + line.Length + 2);
-            builder.Append(LogText);
-            builder.AppendLine(line);
-            LogText = builder.ToString();
+            // Segments render in parallel, so ffmpeg output can arrive from several threads at once.
+            lock (_logLock)
+            {
+                _logging.Write(line);
+
+                // Append to a long-lived buffer instead of copying the whole log into a new builder per line.
+                // Once it outgrows the cap, drop the older half at a line boundary so trimming stays rare.
+                _logBuilder.AppendLine(line);
+                if (_logBuilder.Length > MaxLogTextLength)
+                {
+                    var keepFrom = _logBuilder.Length - MaxLogTextLength / 2;
+                    while (keepFrom < _logBuilder.Length && _logBuilder[keepFrom - 1] != '\n')
+                    {
+                        keepFrom++;
+                    }
+
+                    _logBuilder.Remove(0, keepFrom);
+                }
+
+                LogText = _logBuilder.ToString();
+            }
+        }
+
+        private void FlushLog()
+        {
+            lock (_logLock)
+            {
+                _logging.Flush();
+            }
         }
 
         private void CheckSrtAlignmentAgainstAudio()
@@ -368,7 +503,21 @@ namespace SherafyVideoMaker
 
         private async void DownloadClip(object sender, RoutedEventArgs e)
         {
-            await EnsureDownloadIfNeeded(showSuccessToast: true);
+            if (IsBusy)
+            {
+                return;
+            }
+
+            IsBusy = true;
+            try
+            {
+                await EnsureDownloadIfNeeded(showSuccessToast: true);
+            }
+            finally
+            {
+                IsBusy = false;
+                FlushLog();
+            }
         }
 
         private async Task<bool> EnsureDownloadIfNeeded(bool showSuccessToast = false)
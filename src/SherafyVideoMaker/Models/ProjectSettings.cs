@@ -17,6 +17,7 @@ namespace SherafyVideoMaker.Models
         public string LogFolder { get; set; } = Path.Combine(Environment.CurrentDirectory, "logs");
         public string DownloadsFolder { get; set; } = Path.Combine(Environment.CurrentDirectory, "clips_downloads");
         public bool UseGpuWhenAvailable { get; set; } = true;
+        public int MaxParallelRenders { get; set; } = 1;
         public bool EnableWatermark { get; set; }
         public string WatermarkPath { get; set; } = string.Empty;
         public double WatermarkOpacity { get; set; } = 0.75;
@@ -58,6 +59,11 @@ namespace SherafyVideoMaker.Models
                 return ValidationResult.Fail("FPS must be greater than zero.");
             }
 
+            if (MaxParallelRenders < 1)
+            {
+                return ValidationResult.Fail("Parallel renders must be at least 1.");
+            }
+
             if (EnableWatermark)
             {
                 if (string.IsNullOrWhiteSpace(WatermarkPath) || !File.Exists(WatermarkPath))
@@ -111,6 +117,9 @@ namespace SherafyVideoMaker.Models
 
             return ValidationResult.Success();
         }
+
+        // Renders read settings from worker threads, so they get a private copy the UI cannot change mid-render.
+        public ProjectSettings Snapshot() => (ProjectSettings)MemberwiseClone();
     }
 
     public enum WatermarkPosition
@@ -23,5 +23,7 @@ namespace SherafyVideoMaker.Models
         public FitMode FitMode { get; set; } = FitMode.Auto;
 
         public TimeSpan Duration => End - Start;
+
+        public Segment Snapshot() => (Segment)MemberwiseClone();
     }
 }
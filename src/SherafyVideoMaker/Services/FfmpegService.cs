@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.Globalization;
@@ -10,10 +11,25 @@ namespace SherafyVideoMaker.Services
 {
     public class FfmpegService
     {
+        public const string NvencEncoder = "h264_nvenc";
+
         private string? _selectedVideoEncoder;
         private bool? _lastUseGpuSetting;
 
-        public void ProcessSegment(ProjectSettings settings, Segment segment, string clipPath, Action<string> log)
+        // Keep ffmpeg from waiting on stdin and from streaming banner/progress noise into the log;
+        // only errors that explain a failure are worth relaying.
+        private const string CommonFfmpegArgs = "-hide_banner -nostdin -loglevel error";
+
+        // ffprobe results keyed by file identity, so re-renders and repeated alignment checks
+        // do not spawn a new ffprobe process for media that has not changed on disk.
+        private readonly ConcurrentDictionary<(string Path, DateTime LastWriteUtc, long Length), double> _durationCache = new();
+
+        public void ProcessSegment(
+            ProjectSettings settings,
+            Segment segment,
+            string clipPath,
+            string videoEncoder,
+            Action<string> log)
         {
             if (string.IsNullOrWhiteSpace(segment.AssignedClip))
             {
@@ -52,7 +68,6 @@ namespace SherafyVideoMaker.Services
             }
 
             var (targetWidth, targetHeight) = GetTargetSize(settings.AspectRatio);
-            var videoEncoder = GetVideoEncoder(settings, log);
 
             // IMPORTANT FIX: use "increase" instead of invalid "cover"
             // This scales up to fill the frame, then crops.
@@ -155,7 +170,11 @@ namespace SherafyVideoMaker.Services
             }
         }
 
-        public string? ConcatAndMux(ProjectSettings settings, IList<Segment> segments, Action<string> log)
+        public string? ConcatAndMux(
+            ProjectSettings settings,
+            IList<Segment> segments,
+            string videoEncoder,
+            Action<string> log)
         {
             var ffmpegPath = Path.Combine(settings.FfmpegFolder, "ffmpeg.exe");
             var concatPath = Path.Combine(settings.TempFolder, "concat_list.txt");
@@ -182,10 +201,9 @@ namespace SherafyVideoMaker.Services
             }
 
             var outputFile = Path.Combine(settings.OutputFolder, "final_output.mp4");
-            var videoEncoder = GetVideoEncoder(settings, log);
-            var concatArgs = BuildConcatArgs(settings, concatPath, videoEncoder, durationText, outputFile, log);
+            var concatArgs = BuildConcatArgs(settings, concatPath, durationText, outputFile, log);
 
-            log("Running final concat + audio...");
+            log($"Running final concat + audio (stream-copying {videoEncoder} video from all segment clips)...");
             log($"FFmpeg args (final): {concatArgs}");
 
             var code = RunProcess(ffmpegPath, concatArgs, log);
@@ -207,24 +225,27 @@ namespace SherafyVideoMaker.Services
         private string BuildConcatArgs(
             ProjectSettings settings,
             string concatPath,
-            string videoEncoder,
             string durationText,
             string outputFile,
             Action<string> log)
         {
-            var baseInputs = $"-y -f concat -safe 0 -i \"{concatPath}\" -i \"{settings.AudioPath}\"";
+            var baseInputs = $"{CommonFfmpegArgs} -y -f concat -safe 0 -i \"{concatPath}\" -i \"{settings.AudioPath}\"";
+
+            // The render passes one settings snapshot and one encoder to every ProcessSegment call, which also
+            // forces yuv420p and SAR 1, so all clips share one H.264 layout and the video can be copied as-is.
+            const string videoCodec = "copy";
 
             if (!settings.EnableBackgroundMusic)
             {
                 return
-                    $"{baseInputs} -map 0:v -map 1:a -c:v {videoEncoder} -c:a aac -t {durationText} -shortest \"{outputFile}\"";
+                    $"{baseInputs} -map 0:v -map 1:a -c:v {videoCodec} -c:a aac -t {durationText} -shortest \"{outputFile}\"";
             }
 
             var backgroundInputs = BuildBackgroundMusicInputArgs(settings, log);
             var filterComplex = BuildBackgroundMusicFilters(settings, durationText, log);
 
             return
-                $"{baseInputs} {backgroundInputs} -filter_complex \"{filterComplex}\" -map 0:v -map \"[mixa]\" -c:v {videoEncoder} -c:a aac -t {durationText} -shortest \"{outputFile}\"";
+                $"{baseInputs} {backgroundInputs} -filter_complex \"{filterComplex}\" -map 0:v -map \"[mixa]\" -c:v {videoCodec} -c:a aac -t {durationText} -shortest \"{outputFile}\"";
         }
 
         private static string BuildBackgroundMusicInputArgs(ProjectSettings settings, Action<string> log)
@@ -296,18 +317,21 @@ namespace SherafyVideoMaker.Services
             string outputClip,
             bool useWatermark)
         {
-            var inputArgs = $"-y -i \"{inputClip}\" ";
+            var inputArgs = $"{CommonFfmpegArgs} -y -i \"{inputClip}\" ";
             if (useWatermark)
             {
                 inputArgs += $"-i \"{settings.WatermarkPath}\" ";
             }
 
+            // The final concat stream-copies these clips, so every one must share pixel format and SAR
+            // (and therefore H.264 profile) regardless of what the source footage used.
+            var normalizedFilters = $"{filters},setsar=1";
             var filterArgs = useWatermark
-                ? BuildWatermarkFilter(filters, settings)
-                : $"-vf \"{filters}\"";
+                ? BuildWatermarkFilter(normalizedFilters, settings)
+                : $"-vf \"{normalizedFilters}\"";
 
             return
-                $"{inputArgs}-t {slotText} -an {filterArgs} -r {settings.Fps} -c:v {videoEncoder} \"{outputClip}\"";
+                $"{inputArgs}-t {slotText} -an {filterArgs} -r {settings.Fps} -c:v {videoEncoder} -pix_fmt yuv420p \"{outputClip}\"";
         }
 
         private static string BuildWatermarkFilter(string filters, ProjectSettings settings)
@@ -397,7 +421,7 @@ namespace SherafyVideoMaker.Services
             return process.ExitCode;
         }
 
-        private string GetVideoEncoder(ProjectSettings settings, Action<string> log)
+        public string GetVideoEncoder(ProjectSettings settings, Action<string> log)
         {
             if (!string.IsNullOrWhiteSpace(_selectedVideoEncoder) && _lastUseGpuSetting == settings.UseGpuWhenAvailable)
             {
@@ -411,14 +435,14 @@ namespace SherafyVideoMaker.Services
 
             if (settings.UseGpuWhenAvailable)
             {
-                if (EncoderAvailable(ffmpegPath, "h264_nvenc", log))
+                if (EncoderAvailable(ffmpegPath, NvencEncoder, log))
                 {
-                    _selectedVideoEncoder = "h264_nvenc";
-                    log("Using GPU encoder: h264_nvenc.");
+                    _selectedVideoEncoder = NvencEncoder;
+                    log($"Using GPU encoder: {NvencEncoder}.");
                     return _selectedVideoEncoder;
                 }
 
-                log("GPU encoder h264_nvenc not available; falling back to libx264.");
+                log($"GPU encoder {NvencEncoder} not available; falling back to libx264.");
             }
             else
             {
@@ -470,7 +494,7 @@ namespace SherafyVideoMaker.Services
             return isAvailable;
         }
 
-        private static double GetClipDuration(ProjectSettings settings, string clipPath, Action<string> log)
+        private double GetClipDuration(ProjectSettings settings, string clipPath, Action<string> log)
         {
             var ffprobePath = Path.Combine(settings.FfmpegFolder, "ffprobe.exe");
             return GetMediaDuration(ffprobePath, clipPath, log);
@@ -487,7 +511,7 @@ namespace SherafyVideoMaker.Services
             return GetMediaDuration(ffprobePath, settings.AudioPath, log);
         }
 
-        private static double GetMediaDuration(string ffprobePath, string mediaPath, Action<string> log)
+        private double GetMediaDuration(string ffprobePath, string mediaPath, Action<string> log)
         {
             if (!File.Exists(ffprobePath))
             {
@@ -499,6 +523,14 @@ namespace SherafyVideoMaker.Services
                 throw new FileNotFoundException("Media file not found.", mediaPath);
             }
 
+            var file = new FileInfo(mediaPath);
+            var cacheKey = (file.FullName, file.LastWriteTimeUtc, file.Length);
+            if (_durationCache.TryGetValue(cacheKey, out var cachedDuration))
+            {
+                log($"Using cached media duration: {cachedDuration.ToString("0.###", CultureInfo.InvariantCulture)}s");
+                return cachedDuration;
+            }
+
             var startInfo = new ProcessStartInfo
             {
                 FileName = ffprobePath,
@@ -524,6 +556,7 @@ namespace SherafyVideoMaker.Services
             }
 
             log($"Detected media duration: {duration.ToString("0.###", CultureInfo.InvariantCulture)}s");
+            _durationCache[cacheKey] = duration;
             return duration;
         }
     }
@@ -4,10 +4,13 @@ using SherafyVideoMaker.Models;
 
 namespace SherafyVideoMaker.Services
 {
-    public class LoggingService
+    // Not thread-safe on its own: MainWindow.Log serializes every call under its log lock.
+    public class LoggingService : IDisposable
     {
         private readonly ProjectSettings _settings;
         private readonly string _logFile;
+        private StreamWriter? _writer;
+        private bool _disposed;
 
         public LoggingService(ProjectSettings settings)
         {
@@ -21,9 +24,40 @@ namespace SherafyVideoMaker.Services
         }
 
         public void Write(string message)
+        {
+            if (_disposed)
+            {
+                return;
+            }
+
+            // Keep one buffered handle open for the session rather than reopening the file for every ffmpeg line;
+            // Flush is called when each render/validate/download finishes and Dispose when the window closes.
+            _writer ??= OpenWriter();
+            _writer.WriteLine(message);
+        }
+
+        public void Flush()
+        {
+            _writer?.Flush();
+        }
+
+        public void Dispose()
+        {
+            if (_disposed)
+            {
+                return;
+            }
+
+            _disposed = true;
+            _writer?.Dispose();
+            _writer = null;
+        }
+
+        private StreamWriter OpenWriter()
         {
             EnsureLogFolder();
-            File.AppendAllText(_logFile, message + Environment.NewLine);
+            var stream = new FileStream(_logFile, FileMode.Append, FileAccess.Write, FileShare.Read);
+            return new StreamWriter(stream);
         }
     }
 }
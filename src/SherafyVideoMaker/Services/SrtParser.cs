@@ -21,7 +21,8 @@ namespace SherafyVideoMaker.Services
             if (!File.Exists(path))
                 throw new FileNotFoundException("SRT file not found", path);
 
-            var lines = File.ReadAllLines(path);
+            // Stream lines instead of materialising the whole transcript; Parse is already lazy.
+            var lines = File.ReadLines(path);
             var buffer = new List<string>();
             var index = 0;
             TimeSpan? start = null;
@@ -49,15 +50,19 @@ namespace SherafyVideoMaker.Services
                     continue;
                 }
 
-                var match = TimeRegex.Match(line);
-                if (match.Success)
+                // Only timing lines contain the arrow, so skip the regex for index and text lines.
+                var isTimingLine = line.Contains("-->", StringComparison.Ordinal);
+                if (isTimingLine)
                 {
-                    start = ParseTimestamp(match.Groups["start"].Value);
-                    end = ParseTimestamp(match.Groups["end"].Value);
-                    continue;
+                    var match = TimeRegex.Match(line);
+                    if (match.Success)
+                    {
+                        start = ParseTimestamp(match.Groups["start"].ValueSpan);
+                        end = ParseTimestamp(match.Groups["end"].ValueSpan);
+                        continue;
+                    }
                 }
-
-                if (char.IsDigit(line[0]) && !line.Contains("-->"))
+                else if (char.IsDigit(line[0]))
                 {
                     continue;
                 }
@@ -78,9 +83,23 @@ namespace SherafyVideoMaker.Services
             }
         }
 
-        private static TimeSpan ParseTimestamp(string text)
+        private static TimeSpan ParseTimestamp(ReadOnlySpan<char> text)
         {
-            return TimeSpan.ParseExact(text, @"hh\:mm\:ss\,fff", CultureInfo.InvariantCulture);
+            // The regex guarantees the fixed "hh:mm:ss,fff" layout, so read the fields by position
+            // instead of going through TimeSpan.ParseExact for every cue.
+            var hours = int.Parse(text[..2], NumberStyles.None, CultureInfo.InvariantCulture);
+            var minutes = int.Parse(text.Slice(3, 2), NumberStyles.None, CultureInfo.InvariantCulture);
+            var seconds = int.Parse(text.Slice(6, 2), NumberStyles.None, CultureInfo.InvariantCulture);
+            var milliseconds = int.Parse(text.Slice(9, 3), NumberStyles.None, CultureInfo.InvariantCulture);
+
+            // Hours may use the full two-digit SRT range (00-99), so cues past 24h stay valid; out-of-range
+            // minutes or seconds mean a malformed transcript and must not silently shift later segments.
+            if (minutes > 59 || seconds > 59)
+            {
+                throw new FormatException($"Invalid SRT timestamp: {text.ToString()}");
+            }
+
+            return new TimeSpan(0, hours, minutes, seconds, milliseconds);
         }
     }
 }